@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify, make_response
 import logging
+import re
 
 from backend.service.aop_network_service import AOPNetworkService
 from backend.service.aop_suite_logger_manager import logger_manager
@@ -7,6 +8,9 @@ from backend.service.aop_suite_logger_manager import logger_manager
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Project names: alphanumeric, spaces, hyphens, underscores only
+PROJECT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_]+$')
+
 
 aop_app = Blueprint("aop_app", __name__)
 
@@ -78,9 +82,8 @@ def start_project_session():
     if not project_name:
         return jsonify({"error": "Project name is required"}), 400
     
-    # Validate project name (alphanumeric, spaces, hyphens, underscores only)
-    import re
-    if not re.match(r'^[a-zA-Z0-9\s\-_]+$', project_name):
+    # Validate project name
+    if not PROJECT_NAME_PATTERN.match(project_name):
         return jsonify({"error": "Project name contains invalid characters"}), 400
     
     session_id = logger_manager.start_project_session(project_name)
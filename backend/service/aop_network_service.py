@@ -12,6 +12,12 @@ logger = logging.getLogger(__name__)
 
 NETWORK_STATES_DIR = os.path.join(os.path.dirname(__file__), "../../saved_networks")
 
+# Cytoscape node types counted in operation log results
+COMPONENT_NODE_TYPES = frozenset({"component_process", "component_object"})
+GENE_NODE_TYPES = frozenset({"gene", "protein"})
+CHEMICAL_NODE_TYPE = "chemical"
+ORGAN_NODE_TYPE = "organ"
+
 
 class AOPNetworkService:
     """Main service for AOP network operations using the AOP data model"""
@@ -33,7 +39,7 @@ class AOPNetworkService:
             query_type = data.get("query_type", None)
             values = data.get("values", "")
             status = data.get("status", "")
-            cy_elements = data.get("cy_elements", {"elements": []})
+            cy_elements = self._get_cy_elements(data)
             stype = type(status)
             logger.debug(f"Status {stype}")
             self.builder.update_from_json(cy_elements)
@@ -61,20 +67,24 @@ class AOPNetworkService:
             }
 
             # Generate warnings if incomplete
+            mie_count = summary.get("mie_count", 0)
+            ao_count = summary.get("ao_count", 0)
+            ke_count = summary.get("ke_count", 0)
+            ker_count = summary.get("ker_count", 0)
+
             warnings = []
-            if summary.get("mie_count", 0) == 0:
+            if mie_count == 0:
                 warnings.append("No Molecular Initiating Events (MIEs) found")
-            if summary.get("ao_count", 0) == 0:
+            if ao_count == 0:
                 warnings.append("No Adverse Outcomes (AOs) found")
-            if summary.get("ker_count", 0) == 0:
-                if summary.get("mie_count", 0) > 0 or summary.get("ao_count", 0) > 0:
-                    warnings.append("No Key Event Relationships (KERs) found")
+            if ker_count == 0 and (mie_count > 0 or ao_count > 0):
+                warnings.append("No Key Event Relationships (KERs) found")
 
             if warnings:
                 response_data["warning"] = {
                     "type": "incomplete_aop_data",
                     "message": f"Warnings: {'; '.join(warnings)}",
-                    "details": f"Found: {summary.get('mie_count', 0)} MIEs, {summary.get('ao_count', 0)} AOs, {summary.get('ke_count', 0)} intermediate KEs, {summary.get('ker_count', 0)} KERs",
+                    "details": f"Found: {mie_count} MIEs, {ao_count} AOs, {ke_count} intermediate KEs, {ker_count} KERs",
                     "specific_issues": warnings,
                 }
 
@@ -95,11 +105,7 @@ class AOPNetworkService:
             # Extract parameters from JSON payload
             kes = data.get("kes", "")
             go_only = data.get("go_only", False)
-            cy_elements = data.get("cy_elements", {"elements": []})
-
-            # Handle both old format (list) and new format (dict with elements key)
-            if isinstance(cy_elements, list):
-                cy_elements = {"elements": cy_elements}
+            cy_elements = self._get_cy_elements(data)
 
             self.builder.update_from_json(cy_elements)
 
@@ -113,7 +119,7 @@ class AOPNetworkService:
             component_elements = self.builder.network.to_cytoscape_elements()
 
             # Log the result
-            component_count = len([el for el in component_elements["elements"] if el.get('data', {}).get('type') in ['component_process', 'component_object']])
+            component_count = sum(1 for el in component_elements["elements"] if el.get('data', {}).get('type') in COMPONENT_NODE_TYPES)
             self._log_operation_result("component_query", {"component_count": component_count})
 
             return {
@@ -135,11 +141,7 @@ class AOPNetworkService:
 
             # Extract parameters from JSON payload
             include_proteins = data.get("include_proteins", True)
-            cy_elements = data.get("cy_elements", {"elements": []})
-
-            # Handle both old format (list) and new format (dict with elements key)
-            if isinstance(cy_elements, list):
-                cy_elements = {"elements": cy_elements}
+            cy_elements = self._get_cy_elements(data)
 
             self.builder.update_from_json(cy_elements)
 
@@ -153,7 +155,7 @@ class AOPNetworkService:
             gene_elements = self.builder.network.to_cytoscape_elements()
 
             # Log the result
-            gene_count = len([el for el in gene_elements['elements'] if el.get('data', {}).get('type') in ['gene', 'protein']])
+            gene_count = sum(1 for el in gene_elements['elements'] if el.get('data', {}).get('type') in GENE_NODE_TYPES)
             self._log_operation_result("gene_query", {"gene_count": gene_count})
 
             return {
@@ -174,7 +176,7 @@ class AOPNetworkService:
                 return {"error": "Cytoscape elements required"}, 400
 
             # Extract parameters from JSON payload
-            cy_elements = data.get("cy_elements", {"elements": []})
+            cy_elements = self._get_cy_elements(data)
 
             self.builder.update_from_json(cy_elements)
 
@@ -188,7 +190,7 @@ class AOPNetworkService:
             compound_elements = self.builder.network.to_cytoscape_elements()
 
             # Log the result
-            compound_count = len([el for el in compound_elements["elements"] if el.get('data', {}).get('type') == 'chemical'])
+            compound_count = sum(1 for el in compound_elements["elements"] if el.get('data', {}).get('type') == CHEMICAL_NODE_TYPE)
             self._log_operation_result("compound_query", {"compound_count": compound_count})
 
             return {"compound_elements": compound_elements,
@@ -208,11 +210,7 @@ class AOPNetworkService:
 
             # Extract parameters from JSON payload
             kes = data.get("kes", "")
-            cy_elements = data.get("cy_elements", {"elements": []})
-
-            # Handle both old format (list) and new format (dict with elements key)
-            if isinstance(cy_elements, list):
-                cy_elements = {"elements": cy_elements}
+            cy_elements = self._get_cy_elements(data)
 
             self.builder.update_from_json(cy_elements)
 
@@ -226,7 +224,7 @@ class AOPNetworkService:
             organ_elements = self.builder.network.to_cytoscape_elements()
 
             # Log the result
-            organ_count = len([el for el in organ_elements["elements"] if el.get('data', {}).get('type') == 'organ'])
+            organ_count = sum(1 for el in organ_elements["elements"] if el.get('data', {}).get('type') == ORGAN_NODE_TYPE)
             self._log_operation_result("organ_query", {"organ_count": organ_count})
 
             return {
@@ -248,11 +246,7 @@ class AOPNetworkService:
 
             # Extract parameters from JSON payload
             confidence_level = data.get("confidence_level", 80)
-            cy_elements = data.get("cy_elements", {"elements": []})
-
-            # Handle both old format (list) and new format (dict with elements key)
-            if isinstance(cy_elements, list):
-                cy_elements = {"elements": cy_elements}
+            cy_elements = self._get_cy_elements(data)
 
             self.builder.update_from_json(cy_elements)
 
@@ -264,13 +258,16 @@ class AOPNetworkService:
             # Get updated network elements - return as list, not wrapped in object
             expression_elements = self.builder.network.to_cytoscape_elements()
 
+            # Build the expression table once for both the log and the response
+            expression_table = self.builder.network.gene_expression_table()
+
             # Log the result
-            expression_count = len(self.builder.network.gene_expression_table())
+            expression_count = len(expression_table)
             self._log_operation_result("bgee_query", {"expression_count": expression_count})
 
             return {
                 "expression_elements": expression_elements,
-                "expression_data": self.builder.network.gene_expression_table(),
+                "expression_data": expression_table,
                 "gene_table": self.builder.network.gene_table(),  # Add gene table like other methods
                 "sparql_query": query or "# Query failed",
             }, 200
@@ -322,7 +319,7 @@ class AOPNetworkService:
             if not data or "cy_elements" not in data:
                 return {"error": "Cytoscape elements required"}, 400
 
-            cy_elements = data.get("cy_elements", {"elements": []})
+            cy_elements = self._get_cy_elements(data)
             self.builder.update_from_json(cy_elements)
 
             # Get AOP table data
@@ -365,6 +362,15 @@ class AOPNetworkService:
         """Check if there's an active session"""
         return self.logger is not None
 
+    @staticmethod
+    def _get_cy_elements(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract Cytoscape elements from a request payload in dict form"""
+        cy_elements = data.get("cy_elements", {"elements": []})
+        # Handle both old format (list) and new format (dict with elements key)
+        if isinstance(cy_elements, list):
+            return {"elements": cy_elements}
+        return cy_elements
+
     # Private logging methods
     def _log_aop_query_operation(self, query_type: str, values: str, status: str):
         """Log AOP query operation"""
@@ -455,7 +461,7 @@ _, query = builder.query_gene_expression(confidence_level={confidence_level})"""
         if self.logger.entries and self.logger.entries[-1].operation_type == operation_type:
             self.logger.entries[-1].result_summary = str(result_summary)
 
-@dataclass
+@dataclass(slots=True)
 class ServiceResponse:
     """Standardized service response"""
 
@@ -498,25 +504,26 @@ class NetworkStateManager:
                     success=False, error="No saved states found", status_code=404
                 )
 
-            files = sorted(
-                [
+            # Timestamped names sort chronologically, so the latest is the max
+            latest = max(
+                (
                     f
                     for f in os.listdir(self.states_dir)
                     if f.startswith("network_state_") and f.endswith(".json")
-                ],
-                reverse=True,
+                ),
+                default=None,
             )
 
-            if not files:
+            if latest is None:
                 return ServiceResponse(
                     success=False, error="No saved states found", status_code=404
                 )
 
-            filepath = os.path.join(self.states_dir, files[0])
+            filepath = os.path.join(self.states_dir, latest)
             with open(filepath, "r") as f:
                 data = json.load(f)
 
-            logger.info(f"Loaded network state from {files[0]}")
+            logger.info(f"Loaded network state from {latest}")
             return ServiceResponse(success=True, data=data)
 
         except Exception as e:
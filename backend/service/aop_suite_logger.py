@@ -1,5 +1,6 @@
 import json
 import logging
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -7,7 +8,7 @@ import os
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Represents a single logged operation"""
     timestamp: datetime
@@ -126,14 +127,12 @@ class AOPSuiteLogger:
     
     def get_operation_summary(self) -> Dict[str, Any]:
         """Get summary of all logged operations"""
-        operation_counts = {}
-        for entry in self.entries:
-            operation_counts[entry.operation_type] = operation_counts.get(entry.operation_type, 0) + 1
-        
+        operation_counts = Counter(entry.operation_type for entry in self.entries)
+
         return {
             "session_id": self.session_id,
             "total_operations": len(self.entries),
-            "operation_types": operation_counts,
+            "operation_types": dict(operation_counts),
             "start_time": self.entries[0].timestamp.isoformat() if self.entries else None,
             "end_time": self.entries[-1].timestamp.isoformat() if self.entries else None
         }
@@ -52,13 +52,15 @@ class AOPSuiteLoggerManager:
         if not session_id:
             return None
         
-        if session_id not in self._session_loggers:
-            # Session exists but logger was cleaned up, recreate
-            logger = AOPSuiteLogger()
-            logger.session_id = session_id
-            self._session_loggers[session_id] = logger
-        
-        return self._session_loggers[session_id]
+        logger = self._session_loggers.get(session_id)
+        if logger is not None:
+            return logger
+
+        # Session exists but logger was cleaned up, recreate
+        logger = AOPSuiteLogger()
+        logger.session_id = session_id
+        self._session_loggers[session_id] = logger
+        return logger
     
     def get_project_name(self) -> Optional[str]:
         """Get current project name from session"""
@@ -67,8 +69,8 @@ class AOPSuiteLoggerManager:
     def end_session(self) -> None:
         """End current session and cleanup"""
         session_id = self.get_session_id()
-        if session_id and session_id in self._session_loggers:
-            del self._session_loggers[session_id]
+        if session_id:
+            self._session_loggers.pop(session_id, None)
         session.clear()
     
     def clear_current_session_log(self):
@@ -5,16 +5,17 @@ from backend.query.bgee.bgee_query import query_bgee_anatomical_expression
 
 logger = logging.getLogger(__name__)
 
+def _extract_gene_ids(gene_nodes: List[CytoscapeNode]) -> List[str]:
+    """Extract Ensembl IDs from gene nodes, dropping the gene_ node prefix"""
+    return [
+        node.properties.get("gene_id", node.id).removeprefix("gene_")
+        for node in gene_nodes
+    ]
+
 def query_gene_expression_data(gene_nodes: List[CytoscapeNode]) -> List[Dict[str, str]]:
     """Query Bgee for basic gene expression data"""
     try:
-        # Extract Ensembl IDs from nodes
-        gene_ids = []
-        for node in gene_nodes:
-            gene_id = node.properties.get("gene_id", node.id)
-            if gene_id.startswith("gene_"):
-                gene_id = gene_id.replace("gene_", "")
-            gene_ids.append(gene_id)
+        gene_ids = _extract_gene_ids(gene_nodes)
 
         if not gene_ids:
             return []
@@ -32,12 +33,7 @@ def query_gene_expression_data(gene_nodes: List[CytoscapeNode]) -> List[Dict[str
 def query_anatomical_expression_data(gene_nodes: List[CytoscapeNode]) -> List[Dict[str, str]]:
     """Query Bgee for organ-specific expression data"""
     try:
-        gene_ids = []
-        for node in gene_nodes:
-            gene_id = node.properties.get("gene_id", node.id)
-            if gene_id.startswith("gene_"):
-                gene_id = gene_id.replace("gene_", "")
-            gene_ids.append(gene_id)
+        gene_ids = _extract_gene_ids(gene_nodes)
 
         if not gene_ids:
             return []
@@ -5,7 +5,11 @@ let layoutConfig = {};
 // Function to apply font size multiplier to styles (like the original implementation)
 function applyFontSizeToStyles(styles, fontSizeMultiplier) {
     return styles.map(styleRule => {
-        const newStyleRule = JSON.parse(JSON.stringify(styleRule)); // Deep copy
+        // Copy the rule and its style object; only style properties are reassigned below
+        const newStyleRule = { ...styleRule };
+        if (styleRule.style && typeof styleRule.style === 'object') {
+            newStyleRule.style = { ...styleRule.style };
+        }
         
         if (newStyleRule.style && typeof newStyleRule.style === 'object') {
             // Apply font size multiplier to all size-related properties